@@ -1,5 +1,6 @@
 """Binary patching engine for DBFZ executable."""
 
+import re
 from pathlib import Path
 from typing import Any, Dict, Tuple
 from utils.errors import PatchError
@@ -23,30 +24,20 @@ class BinaryPatcher:
         Returns:
             Offset where pattern was found and replaced, or -1 if not found
         """
-        # Split pattern into individual bytes
-        pattern_bytes = pattern.split(' ')
-        pattern_len = len(pattern_bytes)
-
-        # Scan through executable
-        for i in range(len(exe_data) - pattern_len + 1):
-            found = True
-
-            # Check if pattern matches at current position
-            for j, pattern_byte in enumerate(pattern_bytes):
-                # Wildcard matches any byte
-                if pattern_byte == "??":
-                    continue
-
-                # Check if byte matches
-                if int(pattern_byte, 16) != exe_data[i + j]:
-                    found = False
-                    break
-
-            # If pattern found, replace and return offset
-            if found:
-                exe_data[i:i + len(new_bytes)] = new_bytes
-                logger.info(f"Pattern '{pattern}' found and replaced at offset 0x{i:X}")
-                return i
+        # Translate hex pattern into a byte regex ("??" matches any byte) so the
+        # scan runs in the C regex engine instead of a per-byte Python loop
+        regex = b''.join(
+            b'.' if pattern_byte == "??" else re.escape(bytes([int(pattern_byte, 16)]))
+            for pattern_byte in pattern.split(' ')
+        )
+
+        # Leftmost match is the first offset the pattern occurs at
+        match = re.search(regex, exe_data, re.DOTALL)
+        if match:
+            i = match.start()
+            exe_data[i:i + len(new_bytes)] = new_bytes
+            logger.info(f"Pattern '{pattern}' found and replaced at offset 0x{i:X}")
+            return i
 
         # Pattern not found
         logger.warning(f"Pattern '{pattern}' not found in executable")
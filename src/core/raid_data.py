@@ -1,5 +1,8 @@
 """Raid boss data and lookup functions."""
 
+from functools import lru_cache
+from types import MappingProxyType
+
 # Character code to name mapping
 CHARACTER_CODES = {
     "AAA": "(Empty Slot)",
@@ -93,44 +96,44 @@ RAID_MAIN_BOSS = {
 
 # All characters that appear in each raid (derived from RaidEventTable)
 RAID_CHARACTERS = {
-    1: ["FRN", "GNN", "NPN"],
-    2: ["CEN"],
-    3: ["BUK"],
-    4: ["HTN"],
-    5: ["BSN", "GKB", "VGB"],
-    6: ["AEN", "ASN", "BUK", "BUN", "CEN", "FRN", "GKS", "TNN", "TON", "VGS", "YMN"],
-    7: ["KRN", "TNN", "YMN"],
-    8: ["BRS"],
-    9: ["BDN"],
-    10: ["GKB", "TRS", "VGB", "VGN", "VTB"],
-    11: ["GBR", "ZMB"],
-    12: ["GKN", "KRN", "PCN"],
-    13: ["NPN", "VGN"],
-    14: ["AEN", "ASN", "AVP"],
-    15: ["CLF", "FRN"],
-    16: ["JRN"],
-    17: ["GHU", "GTL", "VDN"],
-    18: ["GKB", "GKN", "GKS", "SGN"],
-    19: ["BUK", "CEN", "FRN", "JNN"],
-    20: ["GKB", "GKN", "GKS", "NHY", "VGB", "VGN", "VGS", "VTB"],
-    21: ["BRS", "EST", "FRN"],
-    22: ["AEN", "AVP", "CEN", "FRN", "GBR", "TRS", "ZMB"],
-    23: ["GBR", "ZMB"],
-    24: ["GKS", "GTL", "PCN"],
-    25: ["GHT", "GHU", "GTL", "TRS"],
-    26: ["ASN", "GHT", "GHU", "GKS", "PCN", "VDN"],
-    27: ["AEN", "AVP", "FRN", "GHU", "GKB", "GKS", "KRN", "PCN", "TNN", "VGB"],
-    28: ["GHT", "GKN", "GKS", "KRN", "PCN"],
-    29: ["GKN", "KRN", "TNN", "YMN"],
-    30: ["GKN", "KRN", "PCN", "TNN", "YMN"],
-    31: ["BSN", "GBR", "GKB", "VGB", "VTB", "ZMB"],
-    32: ["HTN", "KFS"],
-    33: ["BSN", "GKB", "GKN", "JRN", "MGS"],
-    34: ["BUK", "CEN", "GBR", "GHT", "GHU", "GKB", "GKN", "GKS", "KRN", "MTN", "NHY", "SGN", "VTB", "YMN"],
-    35: ["GFF", "GTL", "KFS", "NHY", "VTB", "ZMB"],
-    36: ["AEN", "BDN", "BRS", "GHU", "KRN", "OSM", "TRS", "VDN"],
-    37: ["AEN", "ASN", "AVP", "CEN", "TON", "TOP"],
-    38: ["BRS", "BSN", "BUK", "CEN", "CLF", "EST", "FRN", "GFF", "GKS", "HTN", "JNN", "JRN", "MGS", "NHY", "TRS", "VGB", "VGS", "VTB", "ZMB"],
+    1: ("FRN", "GNN", "NPN"),
+    2: ("CEN",),
+    3: ("BUK",),
+    4: ("HTN",),
+    5: ("BSN", "GKB", "VGB"),
+    6: ("AEN", "ASN", "BUK", "BUN", "CEN", "FRN", "GKS", "TNN", "TON", "VGS", "YMN"),
+    7: ("KRN", "TNN", "YMN"),
+    8: ("BRS",),
+    9: ("BDN",),
+    10: ("GKB", "TRS", "VGB", "VGN", "VTB"),
+    11: ("GBR", "ZMB"),
+    12: ("GKN", "KRN", "PCN"),
+    13: ("NPN", "VGN"),
+    14: ("AEN", "ASN", "AVP"),
+    15: ("CLF", "FRN"),
+    16: ("JRN",),
+    17: ("GHU", "GTL", "VDN"),
+    18: ("GKB", "GKN", "GKS", "SGN"),
+    19: ("BUK", "CEN", "FRN", "JNN"),
+    20: ("GKB", "GKN", "GKS", "NHY", "VGB", "VGN", "VGS", "VTB"),
+    21: ("BRS", "EST", "FRN"),
+    22: ("AEN", "AVP", "CEN", "FRN", "GBR", "TRS", "ZMB"),
+    23: ("GBR", "ZMB"),
+    24: ("GKS", "GTL", "PCN"),
+    25: ("GHT", "GHU", "GTL", "TRS"),
+    26: ("ASN", "GHT", "GHU", "GKS", "PCN", "VDN"),
+    27: ("AEN", "AVP", "FRN", "GHU", "GKB", "GKS", "KRN", "PCN", "TNN", "VGB"),
+    28: ("GHT", "GKN", "GKS", "KRN", "PCN"),
+    29: ("GKN", "KRN", "TNN", "YMN"),
+    30: ("GKN", "KRN", "PCN", "TNN", "YMN"),
+    31: ("BSN", "GBR", "GKB", "VGB", "VTB", "ZMB"),
+    32: ("HTN", "KFS"),
+    33: ("BSN", "GKB", "GKN", "JRN", "MGS"),
+    34: ("BUK", "CEN", "GBR", "GHT", "GHU", "GKB", "GKN", "GKS", "KRN", "MTN", "NHY", "SGN", "VTB", "YMN"),
+    35: ("GFF", "GTL", "KFS", "NHY", "VTB", "ZMB"),
+    36: ("AEN", "BDN", "BRS", "GHU", "KRN", "OSM", "TRS", "VDN"),
+    37: ("AEN", "ASN", "AVP", "CEN", "TON", "TOP"),
+    38: ("BRS", "BSN", "BUK", "CEN", "CLF", "EST", "FRN", "GFF", "GKS", "HTN", "JNN", "JRN", "MGS", "NHY", "TRS", "VGB", "VGS", "VTB", "ZMB"),
 }
 
 # Risk levels (difficulty stars) for each raid
@@ -216,6 +219,49 @@ RAID_BOSSES = {
     38: "Ultimate Zenkai Battle"
 }
 
+# The tables above are never written after import; expose them read-only
+CHARACTER_CODES = MappingProxyType(CHARACTER_CODES)
+RAID_MAIN_BOSS = MappingProxyType(RAID_MAIN_BOSS)
+RAID_CHARACTERS = MappingProxyType(RAID_CHARACTERS)
+RAID_RISK_LEVELS = MappingProxyType(RAID_RISK_LEVELS)
+RAID_BOSSES = MappingProxyType(RAID_BOSSES)
+
+# Unordered roster per raid for membership tests (RAID_CHARACTERS keeps display order)
+RAID_CHARACTERS_SET = MappingProxyType({
+    idx: frozenset(codes) for idx, codes in RAID_CHARACTERS.items()
+})
+
+# Valid raid ids; currently a dense range, so the bounds check rejects most misses
+_VALID_RAID_IDS = frozenset(RAID_BOSSES)
+_RAID_MIN = min(_VALID_RAID_IDS)
+_RAID_MAX = max(_VALID_RAID_IDS)
+
+# Pre-built display strings, computed once at import since the data above is static
+_RAID_CHARS_STR = {
+    idx: ", ".join(CHARACTER_CODES.get(code, code) for code in RAID_CHARACTERS.get(idx, ()))
+    for idx in RAID_BOSSES
+}
+
+# Indexed directly by raid id (ids are dense); None marks ids with no raid
+_RAID_DISPLAY = tuple(
+    f"{idx}: {RAID_BOSSES[idx]} ({CHARACTER_CODES.get(RAID_MAIN_BOSS.get(idx, '???'), '???')})"
+    if idx in RAID_BOSSES else None
+    for idx in range(max(RAID_BOSSES) + 1)
+)
+
+_ALL_RAIDS = tuple(sorted(RAID_BOSSES.items()))
+
+_ALL_RAIDS_WITH_BOSSES = tuple(
+    (
+        idx,
+        name,
+        CHARACTER_CODES.get(RAID_MAIN_BOSS.get(idx, "???"), "???"),
+        _RAID_CHARS_STR[idx],
+        RAID_RISK_LEVELS.get(idx, 0),
+    )
+    for idx, name in _ALL_RAIDS
+)
+
 
 def get_raid_name(raid_index: int) -> str:
     """
@@ -230,14 +276,14 @@ def get_raid_name(raid_index: int) -> str:
     return RAID_BOSSES.get(raid_index, f"Unknown Raid {raid_index}")
 
 
-def get_all_raids() -> list[tuple[int, str]]:
+def get_all_raids() -> tuple[tuple[int, str], ...]:
     """
     Get all raids as (index, name) tuples for UI display.
 
     Returns:
-        List of (index, name) tuples sorted by index
+        Tuple of (index, name) tuples sorted by index
     """
-    return [(idx, name) for idx, name in sorted(RAID_BOSSES.items())]
+    return _ALL_RAIDS
 
 
 def is_valid_raid_index(raid_index: int) -> bool:
@@ -250,7 +296,7 @@ def is_valid_raid_index(raid_index: int) -> bool:
     Returns:
         True if valid (1-38), False otherwise
     """
-    return raid_index in RAID_BOSSES
+    return _RAID_MIN <= raid_index <= _RAID_MAX and raid_index in _VALID_RAID_IDS
 
 
 def get_character_name(code: str) -> str:
@@ -303,12 +349,14 @@ def get_raid_display(raid_index: int) -> str:
     Returns:
         Formatted string like "1: The Emperor Strikes Back (Frieza)"
     """
-    name = get_raid_name(raid_index)
-    boss = get_raid_boss(raid_index)
-    return f"{raid_index}: {name} ({boss})"
+    display = _RAID_DISPLAY[raid_index] if 0 <= raid_index < len(_RAID_DISPLAY) else None
+    if display is None:
+        display = f"{raid_index}: {get_raid_name(raid_index)} ({get_raid_boss(raid_index)})"
+    return display
 
 
-def get_raid_characters(raid_index: int) -> list[str]:
+@lru_cache(maxsize=64)
+def get_raid_characters(raid_index: int) -> tuple[str, ...]:
     """
     Get all character names that appear in a raid.
 
@@ -316,10 +364,10 @@ def get_raid_characters(raid_index: int) -> list[str]:
         raid_index: Raid number (1-38)
 
     Returns:
-        List of character names
+        Tuple of character names
     """
-    codes = RAID_CHARACTERS.get(raid_index, [])
-    return [get_character_name(code) for code in codes]
+    codes = RAID_CHARACTERS.get(raid_index, ())
+    return tuple(get_character_name(code) for code in codes)
 
 
 def get_raid_characters_str(raid_index: int) -> str:
@@ -332,7 +380,24 @@ def get_raid_characters_str(raid_index: int) -> str:
     Returns:
         Comma-separated character names
     """
-    return ", ".join(get_raid_characters(raid_index))
+    chars = _RAID_CHARS_STR.get(raid_index)
+    if chars is None:
+        chars = ", ".join(get_raid_characters(raid_index))
+    return chars
+
+
+def raid_contains(raid_index: int, code: str) -> bool:
+    """
+    Check whether a character appears in a raid.
+
+    Args:
+        raid_index: Raid number (1-38)
+        code: 3-letter character code (e.g., "FRN")
+
+    Returns:
+        True if the character is in the raid's roster
+    """
+    return code in RAID_CHARACTERS_SET.get(raid_index, frozenset())
 
 
 def get_raid_risk_level(raid_index: int) -> int:
@@ -348,14 +413,11 @@ def get_raid_risk_level(raid_index: int) -> int:
     return RAID_RISK_LEVELS.get(raid_index, 0)
 
 
-def get_all_raids_with_bosses() -> list[tuple[int, str, str, str, int]]:
+def get_all_raids_with_bosses() -> tuple[tuple[int, str, str, str, int], ...]:
     """
     Get all raids as (index, name, boss, characters, risk) tuples for UI display.
 
     Returns:
-        List of (index, raid_name, boss_name, characters_str, risk_level) tuples sorted by index
+        Tuple of (index, raid_name, boss_name, characters_str, risk_level) tuples sorted by index
     """
-    return [
-        (idx, name, get_raid_boss(idx), get_raid_characters_str(idx), get_raid_risk_level(idx))
-        for idx, name in sorted(RAID_BOSSES.items())
-    ]
+    return _ALL_RAIDS_WITH_BOSSES
@@ -1,11 +1,100 @@
 """Backup management for clean game executable."""
 
+import os
+import re
+import mmap
 import shutil
 import logging
 from pathlib import Path
 from typing import Optional, Callable
+from core.raid_data import RAID_BOSSES
+from file_manager.shortcut import is_raid_shortcut_name
 from utils.errors import BackupError
-from utils.logger import logger
+from utils.logger import LOG_DIR, logger
+
+# Raid patch signature: B8 [4 bytes] 90 (mov eax, immediate; nop).
+# Lookahead keeps matches overlapping so no candidate offset is skipped.
+_RAID_PATCH_PATTERN = re.compile(rb'\xB8(?=(.{4})\x90)', re.DOTALL)
+
+# Little-endian encodings of every valid raid index, so candidates are
+# validated with one set probe instead of decoding each to an int
+_VALID_RAID_BYTES = frozenset(idx.to_bytes(4, byteorder='little') for idx in RAID_BOSSES)
+
+
+def close_log_handlers(log_dir: Path):
+    """
+    Flush, close and detach logger file handlers writing inside a directory.
+
+    Args:
+        log_dir: Directory whose log files are about to be removed
+    """
+    try:
+        # Resolve the logs dir once; handler paths are already absolute,
+        # so a prefix test against both forms replaces per-handler resolve()
+        try:
+            log_dir_resolved = log_dir.resolve()
+        except Exception:
+            log_dir_resolved = log_dir
+        log_dir_prefixes = tuple(
+            os.path.join(os.path.normcase(str(d)), '')
+            for d in {log_dir_resolved, log_dir.absolute()}
+        )
+
+        # Collect matches first so the handler list is not mutated mid-iteration
+        to_remove = []
+        for handler in logger.handlers:
+            base_filename = getattr(handler, 'baseFilename', None)
+            if base_filename:
+                handler_path = os.path.normcase(os.path.abspath(base_filename))
+                if handler_path.startswith(log_dir_prefixes):
+                    to_remove.append(handler)
+
+        for handler in to_remove:
+            logger.debug("Closing log handler for file: %s", handler.baseFilename)
+            try:
+                handler.flush()
+            except Exception:
+                pass
+            try:
+                handler.close()
+            except Exception:
+                pass
+            try:
+                logger.removeHandler(handler)
+            except Exception:
+                pass
+    except Exception as e:
+        logger.warning("Failed while attempting to close log handlers: %s", e)
+
+
+def remove_tree(path: Path):
+    """
+    Delete a directory tree bottom-up without recursing in Python.
+
+    Args:
+        path: Directory to remove
+
+    Raises:
+        FileNotFoundError: If path does not exist
+        OSError: If any directory cannot be listed, or any entry or the
+            directory itself cannot be removed
+    """
+    # os.walk skips unreadable directories by default; surface the real error
+    # instead of a later "directory not empty" from the parent rmdir
+    def _raise(error: OSError):
+        raise error
+
+    for root, dirs, files in os.walk(path, topdown=False, onerror=_raise):
+        for name in files:
+            os.unlink(os.path.join(root, name))
+        for name in dirs:
+            dir_path = os.path.join(root, name)
+            # Walk does not descend into directory symlinks; drop the link itself
+            if os.path.islink(dir_path):
+                os.unlink(dir_path)
+            else:
+                os.rmdir(dir_path)
+    os.rmdir(path)
 
 
 class BackupManager:
@@ -27,13 +116,13 @@ class BackupManager:
             BackupError: If clean exe doesn't exist
         """
         if not clean_exe.exists():
-            logger.error(f"Clean executable not found: {clean_exe}")
+            logger.error("Clean executable not found: %s", clean_exe)
             raise BackupError(
                 f"Original game executable not found at {clean_exe}. "
                 "Please verify game files via Steam."
             )
 
-        logger.info(f"Clean exe verified: {clean_exe}")
+        logger.info("Clean exe verified: %s", clean_exe)
         return True
 
     def create_or_update_patched_exe(
@@ -66,20 +155,20 @@ class BackupManager:
         # Remove old patched exe if it exists
         if patched_exe.exists():
             try:
-                logger.info(f"Removing old patched exe: {patched_exe}")
+                logger.info("Removing old patched exe: %s", patched_exe)
                 patched_exe.unlink()
             except Exception as e:
-                logger.warning(f"Could not remove old patched exe: {e}")
+                logger.warning("Could not remove old patched exe: %s", e)
                 # Continue anyway - copy will overwrite
 
         # Copy clean exe to patched exe location
         try:
-            logger.info(f"Creating fresh patched exe from clean exe")
-            shutil.copy2(clean_exe, patched_exe)
-            logger.info(f"Patched exe ready: {patched_exe}")
+            logger.info("Creating fresh patched exe from clean exe")
+            shutil.copyfile(clean_exe, patched_exe)
+            logger.info("Patched exe ready: %s", patched_exe)
             return patched_exe
         except Exception as e:
-            logger.error(f"Failed to create patched exe: {e}")
+            logger.error("Failed to create patched exe: %s", e)
             raise BackupError(f"Failed to create patched exe: {e}")
 
     def detect_current_patch(self, patched_exe: Path) -> Optional[int]:
@@ -100,28 +189,28 @@ class BackupManager:
             return None
 
         try:
-            exe_data = patched_exe.read_bytes()
-
-            # Look for pattern: B8 [4 bytes] 90
-            pattern_start = 0xB8
-            pattern_end = 0x90
-
-            for i in range(len(exe_data) - 5):
-                if exe_data[i] == pattern_start and exe_data[i + 5] == pattern_end:
-                    # Extract 4-byte raid index (little-endian)
-                    raid_bytes = exe_data[i + 1:i + 5]
-                    raid_index = int.from_bytes(raid_bytes, byteorder='little')
-
-                    # Validate raid index (1-38)
-                    if 1 <= raid_index <= 38:
-                        logger.info(f"Detected current patch: Raid {raid_index}")
-                        return raid_index
+            # Map the exe read-only so only the pages touched before a match are read
+            with open(patched_exe, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < 6:
+                    logger.debug("Patched exe too small to contain a raid patch")
+                    return None
+
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as exe_data:
+                    # Both pattern anchors are matched by the regex engine in C
+                    for match in _RAID_PATCH_PATTERN.finditer(exe_data):
+                        # Validate raid index (1-38) on the raw 4 bytes
+                        raid_bytes = match.group(1)
+                        if raid_bytes in _VALID_RAID_BYTES:
+                            # Extract 4-byte raid index (little-endian)
+                            raid_index = int.from_bytes(raid_bytes, byteorder='little')
+                            logger.info("Detected current patch: Raid %s", raid_index)
+                            return raid_index
 
             logger.debug("No valid raid patch detected")
             return None
 
         except Exception as e:
-            logger.error(f"Failed to detect current patch: {e}")
+            logger.error("Failed to detect current patch: %s", e)
             return None
 
     def cleanup_all(self, patched_exe: Path, game_root: Path, progress_callback: Optional[Callable[[str], None]] = None) -> dict:
@@ -149,8 +238,6 @@ class BackupManager:
                 'errors': [str]
             }
         """
-        import os
-
         results = {
             'patched_exe_removed': False,
             'shortcuts_removed': 0,
@@ -163,7 +250,7 @@ class BackupManager:
             try:
                 if progress_callback:
                     progress_callback("Removing patched executable...")
-                logger.info(f"Removing patched exe: {patched_exe}")
+                logger.info("Removing patched exe: %s", patched_exe)
                 patched_exe.unlink()
                 results['patched_exe_removed'] = True
                 logger.info("Patched exe removed successfully")
@@ -179,16 +266,22 @@ class BackupManager:
             progress_callback("Removing raid shortcuts...")
 
         # Remove all shortcuts in game root folder
+        # (scandir entries carry type info, so no Path objects or extra stats)
         try:
-            for shortcut in game_root.glob("DBFZ Raid *.lnk"):
-                try:
-                    logger.info(f"Removing shortcut: {shortcut.name}")
-                    shortcut.unlink()
-                    results['shortcuts_removed'] += 1
-                except Exception as e:
-                    error_msg = f"Failed to remove shortcut {shortcut.name}: {e}"
-                    logger.error(error_msg)
-                    results['errors'].append(error_msg)
+            with os.scandir(game_root) as entries:
+                for entry in entries:
+                    if not is_raid_shortcut_name(entry.name):
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    try:
+                        logger.info("Removing shortcut: %s", entry.name)
+                        os.unlink(entry.path)
+                        results['shortcuts_removed'] += 1
+                    except Exception as e:
+                        error_msg = f"Failed to remove shortcut {entry.name}: {e}"
+                        logger.error(error_msg)
+                        results['errors'].append(error_msg)
         except Exception as e:
             error_msg = f"Error scanning for shortcuts in game folder: {e}"
             logger.error(error_msg)
@@ -199,44 +292,17 @@ class BackupManager:
             progress_callback("Removing application logs...")
 
         # Remove application logs directory created by the program
-        log_dir = Path.home() / ".dbfz_raid_enabler"
+        log_dir = LOG_DIR
         try:
             if log_dir.exists():
                 if progress_callback:
                     progress_callback("Closing log file handles...")
-                logger.info(f"Preparing to remove application logs directory: {log_dir}")
-
-                # Try to close any file handlers that might be holding files open in the logs dir
-                try:
-                    for handler in logger.handlers[:]:
-                        try:
-                            base_filename = getattr(handler, 'baseFilename', None)
-                            if base_filename:
-                                handler_path = Path(base_filename).resolve()
-                                try:
-                                    log_dir_resolved = log_dir.resolve()
-                                except Exception:
-                                    log_dir_resolved = log_dir
-                                if log_dir_resolved == handler_path or log_dir_resolved in handler_path.parents:
-                                    logger.debug(f"Closing log handler for file: {base_filename}")
-                                    try:
-                                        handler.flush()
-                                    except Exception:
-                                        pass
-                                    try:
-                                        handler.close()
-                                    except Exception:
-                                        pass
-                                    try:
-                                        logger.removeHandler(handler)
-                                    except Exception:
-                                        pass
-                        except Exception as e:
-                            logger.warning(f"Could not close handler {handler}: {e}")
-                except Exception as e:
-                    logger.warning(f"Failed while attempting to close log handlers: {e}")
-
-                shutil.rmtree(log_dir)
+                logger.info("Preparing to remove application logs directory: %s", log_dir)
+
+                # Close any file handlers that might be holding files open in the logs dir
+                close_log_handlers(log_dir)
+
+                remove_tree(log_dir)
                 results['logs_removed'] = True
                 logger.info("Logs directory removed successfully")
             else:
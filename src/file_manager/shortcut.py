@@ -1,18 +1,89 @@
 """Windows shortcut (.lnk) creation and management."""
 
-import win32com.client
+import fnmatch
+import logging
+import re
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
 from utils.errors import ShortcutError
 from utils.logger import logger
 
+# Raid shortcut naming, fixed at import so callers never rebuild these strings
+SHORTCUT_EXTENSION = ".lnk"
+SHORTCUT_NAME_TEMPLATE = "DBFZ Raid {}" + SHORTCUT_EXTENSION
+# Filename pattern matching every raid shortcut this tool creates
+SHORTCUT_GLOB_PATTERN = SHORTCUT_NAME_TEMPLATE.format("*")
+# Glob compiled once; case-insensitive like fnmatch on Windows
+_SHORTCUT_NAME_REGEX = re.compile(fnmatch.translate(SHORTCUT_GLOB_PATTERN), re.IGNORECASE)
+
+
+def is_raid_shortcut_name(name: str) -> bool:
+    """
+    Check whether a filename matches the raid shortcut pattern.
+
+    Args:
+        name: Bare filename (no directory)
+
+    Returns:
+        True if the name is a raid shortcut this tool creates
+    """
+    return _SHORTCUT_NAME_REGEX.match(name) is not None
+
 
 class ShortcutManager:
     """
     Create and manage Windows .lnk shortcuts.
-    Uses win32com to create proper Windows shortcuts.
+    Uses the IShellLink COM interface to create proper Windows shortcuts.
+
+    Instances are thread-affine: the COM apartment is entered once, on first
+    use, for the calling thread, so use each manager from that thread and
+    call close() when done. pywin32 is only imported on first use, so code
+    that never touches a shortcut does not pay for loading COM.
     """
 
+    def __init__(self):
+        self._pythoncom = None
+        self._shell = None
+        self._com_initialized = False
+
+    def close(self):
+        """Leave the COM apartment entered on first use."""
+        if self._com_initialized:
+            self._com_initialized = False
+            self._pythoncom.CoUninitialize()
+
+    def _load_com(self):
+        """Import pywin32 COM modules and enter the COM apartment once."""
+        if self._pythoncom is None:
+            import pythoncom
+            from win32com.shell import shell
+
+            try:
+                pythoncom.CoInitialize()
+                self._com_initialized = True
+            except pythoncom.com_error as e:
+                # Thread already in an incompatible apartment; COM calls still work there
+                logger.debug("COM apartment not initialized: %s", e)
+
+            self._pythoncom = pythoncom
+            self._shell = shell
+
+    def _new_shell_link(self):
+        """
+        Create an IShellLink object directly, bypassing WScript.Shell.
+
+        Returns:
+            (IShellLink, IPersistFile) interfaces for the same link object
+        """
+        self._load_com()
+        link = self._pythoncom.CoCreateInstance(
+            self._shell.CLSID_ShellLink,
+            None,
+            self._pythoncom.CLSCTX_INPROC_SERVER,
+            self._shell.IID_IShellLink
+        )
+        return link, link.QueryInterface(self._pythoncom.IID_IPersistFile)
+
     def create_shortcut(
         self,
         target_exe: Path,
@@ -33,29 +104,58 @@ class ShortcutManager:
         Raises:
             ShortcutError: If shortcut creation fails
         """
+        return self.create_shortcuts([(target_exe, shortcut_path, raid_name)])[0]
+
+    def create_shortcuts(
+        self,
+        jobs: Iterable[Tuple[Path, Path, str]]
+    ) -> List[Path]:
+        """
+        Create several Windows shortcuts, reusing one shell link object.
+
+        Args:
+            jobs: (target_exe, shortcut_path, raid_name) tuples, as for create_shortcut
+
+        Returns:
+            Paths to the created shortcuts, in job order
+
+        Raises:
+            ShortcutError: If any shortcut creation fails
+        """
+        created = []
         try:
-            logger.info(f"Creating shortcut: {shortcut_path}")
+            # Every property is set per job, so one link object serves the whole batch
+            link, persist_file = self._new_shell_link()
+
+            for target_exe, shortcut_path, raid_name in jobs:
+                logger.debug("Creating shortcut: %s", shortcut_path)
 
-            # Create shell object
-            shell = win32com.client.Dispatch("WScript.Shell")
+                # Stringify the target once; it is used for both path and icon
+                target_str = str(target_exe)
 
-            # Create shortcut object
-            shortcut = shell.CreateShortCut(str(shortcut_path))
+                # Set properties
+                link.SetPath(target_str)
+                link.SetWorkingDirectory(str(target_exe.parent))
+                link.SetDescription(f"DBFZ Raid: {raid_name}")
+                link.SetIconLocation(target_str, 0)  # Use exe icon
 
-            # Set properties
-            shortcut.TargetPath = str(target_exe)
-            shortcut.WorkingDirectory = str(target_exe.parent)
-            shortcut.Description = f"DBFZ Raid: {raid_name}"
-            shortcut.IconLocation = str(target_exe)  # Use exe icon
+                # Save shortcut
+                persist_file.Save(str(shortcut_path), 0)
 
-            # Save shortcut
-            shortcut.save()
+                logger.debug("Shortcut created successfully: %s", raid_name)
+                created.append(shortcut_path)
 
-            logger.info(f"Shortcut created successfully: {raid_name}")
-            return shortcut_path
+            # One summary line per batch instead of two per shortcut
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Created %d shortcut(s): %s",
+                    len(created),
+                    ", ".join(path.name for path in created)
+                )
+            return created
 
         except Exception as e:
-            logger.error(f"Failed to create shortcut: {e}")
+            logger.error("Failed to create shortcut: %s", e)
             raise ShortcutError(f"Failed to create shortcut: {e}")
 
     def update_shortcut(
@@ -67,8 +167,8 @@ class ShortcutManager:
         """
         Update existing shortcut with new raid name.
 
-        Simply deletes old shortcut and creates new one.
-        This is simpler than trying to modify the existing shortcut.
+        Simply writes a new shortcut over the old one; IPersistFile.Save
+        replaces an existing file, so no delete or existence check is needed.
 
         Args:
             target_exe: Path to executable
@@ -81,16 +181,7 @@ class ShortcutManager:
         Raises:
             ShortcutError: If update fails
         """
-        # Delete old shortcut if it exists
-        if shortcut_path.exists():
-            try:
-                logger.info(f"Removing old shortcut: {shortcut_path}")
-                shortcut_path.unlink()
-            except Exception as e:
-                logger.warning(f"Could not remove old shortcut: {e}")
-                # Continue anyway - will overwrite
-
-        # Create new shortcut
+        # Create new shortcut over the old one
         return self.create_shortcut(target_exe, shortcut_path, raid_name)
 
     def get_shortcut_target(self, shortcut_path: Path) -> Optional[str]:
@@ -103,20 +194,20 @@ class ShortcutManager:
         Returns:
             Target path as string, or None if cannot read
         """
-        if not shortcut_path.exists():
-            logger.debug(f"Shortcut doesn't exist: {shortcut_path}")
-            return None
-
+        # Load directly; only stat the file to explain a failed load
         try:
-            shell = win32com.client.Dispatch("WScript.Shell")
-            shortcut = shell.CreateShortCut(str(shortcut_path))
-            target = shortcut.TargetPath
+            link, persist_file = self._new_shell_link()
+            persist_file.Load(str(shortcut_path))
+            target, _ = link.GetPath(0)
 
-            logger.debug(f"Shortcut target: {target}")
+            logger.debug("Shortcut target: %s", target)
             return target
 
         except Exception as e:
-            logger.error(f"Failed to read shortcut: {e}")
+            if not shortcut_path.exists():
+                logger.debug("Shortcut doesn't exist: %s", shortcut_path)
+            else:
+                logger.error("Failed to read shortcut: %s", e)
             return None
 
     def shortcut_exists(self, shortcut_path: Path) -> bool:
@@ -129,9 +220,10 @@ class ShortcutManager:
         Returns:
             True if shortcut exists and appears valid
         """
-        if not shortcut_path.exists():
+        # Cheap filename and stat check before paying for a COM load
+        if shortcut_path.suffix.lower() != SHORTCUT_EXTENSION or not shortcut_path.is_file():
             return False
 
-        # Try to read target to verify it's a valid shortcut
+        # One load verifies it's a valid shortcut (no second existence check)
         target = self.get_shortcut_target(shortcut_path)
         return target is not None
@@ -58,7 +58,7 @@ class GameLocator:
         if self._library_paths:
             return self._library_paths
 
-        vdf_path = steam_path / "steamapps" / "libraryfolders.vdf"
+        vdf_path = steam_path.joinpath("steamapps", "libraryfolders.vdf")
         libraries = [steam_path]
 
         if not vdf_path.exists():
@@ -91,7 +91,7 @@ class GameLocator:
         manifest_name = f"appmanifest_{self.DBFZ_APP_ID}.acf"
 
         for library in libraries:
-            manifest_path = library / "steamapps" / manifest_name
+            manifest_path = library.joinpath("steamapps", manifest_name)
             if manifest_path.exists():
                 # Parse manifest to get install directory name
                 try:
@@ -100,7 +100,7 @@ class GameLocator:
 
                     app_state = manifest.get('AppState', {})
                     install_dir = app_state.get('installdir', self.GAME_FOLDER_NAME)
-                    game_path = library / "steamapps" / "common" / install_dir
+                    game_path = library.joinpath("steamapps", "common", install_dir)
 
                     # Verify the executable exists
                     exe_path = game_path / self.EXE_RELATIVE_PATH
@@ -117,7 +117,7 @@ class GameLocator:
     def _find_game_via_folder_scan(self, libraries: List[Path]) -> Optional[Path]:
         """Fallback: scan for game folder directly if manifest lookup fails."""
         for library in libraries:
-            game_path = library / "steamapps" / "common" / self.GAME_FOLDER_NAME
+            game_path = library.joinpath("steamapps", "common", self.GAME_FOLDER_NAME)
             exe_path = game_path / self.EXE_RELATIVE_PATH
 
             if exe_path.exists():
@@ -176,7 +176,7 @@ class GameLocator:
         Returns:
             Dictionary with file paths
         """
-        exe_dir = game_root / "RED" / "Binaries" / "Win64"
+        exe_dir = game_root.joinpath("RED", "Binaries", "Win64")
         eac_dir = game_root / "EasyAntiCheat"
 
         return {
@@ -1,7 +1,9 @@
 """Terminal UI for DBFZ Raid Enabler."""
 
 import os
+import stat
 import sys
+from contextlib import contextmanager
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -10,19 +12,69 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.markup import escape
 from rich import box
 from pathlib import Path
-from typing import Optional, Dict, Union
+from typing import Optional, Dict, Iterator, Tuple, Union
 
 from core.patcher import BinaryPatcher
 from core.raid_data import get_all_raids_with_bosses
 from steam.game_locator import GameLocator
-from file_manager.backup import BackupManager
-from file_manager.shortcut import ShortcutManager
+from file_manager.backup import BackupManager, close_log_handlers, remove_tree
+from file_manager.shortcut import ShortcutManager, SHORTCUT_NAME_TEMPLATE, is_raid_shortcut_name
 from utils.errors import (
     DBFZRaidError,
     SteamNotFoundError,
     GameNotFoundError
 )
-from utils.logger import logger
+from utils.logger import LOG_DIR, logger
+
+
+def _unique_paths(paths):
+    """Drop paths that name the same location, keeping the first spelling."""
+    unique = {}
+    for path in paths:
+        unique.setdefault(os.path.normcase(os.path.normpath(path)), path)
+    return tuple(unique.values())
+
+
+# Game folder under a Steam library (matched case-insensitively), and the exe under it
+_COMMON_SUBPATH = os.sep.join(("steamapps", "common"))
+_GAME_FOLDER_KEY = "DRAGON BALL FighterZ".casefold()
+_EXE_SUBPATH = os.sep.join(("RED", "Binaries", "Win64", "RED-Win64-Shipping.exe"))
+
+# Risk column text indexed by risk level (0-5)
+_RISK_STARS = tuple("★" * level for level in range(6))
+
+_RAID_PROMPT = "Select a raid (1-38), 'c' to cleanup, or 'q' to quit"
+
+# Common Steam locations checked when Steam lookup fails. Case variants are
+# kept for case-sensitive filesystems but collapse to one entry on Windows.
+_COMMON_STEAM_BASES = _unique_paths((
+    r"C:\Program Files (x86)\Steam", r"c:\program files (x86)\steam",
+    r"C:\Program Files\Steam", r"c:\program files\steam",
+    r"D:\SteamLibrary", r"d:\steamlibrary",
+    r"D:\Steam", r"d:\steam",
+    r"E:\SteamLibrary", r"e:\steamlibrary",
+    r"E:\Steam", r"e:\steam",
+))
+
+
+# Cleanup result panels: the empty case is fully static, the success body
+# only varies in its list of removed items
+_NOTHING_TO_CLEAN_PANEL = Panel(
+    "[bold yellow]Nothing to Clean[/bold yellow]\n\n"
+    "No modifications found\n"
+    "[dim]Game files are already clean[/dim]",
+    box=box.ROUNDED,
+    border_style="yellow",
+    title="Info"
+)
+
+_CLEANUP_SUCCESS_TEMPLATE = (
+    "[bold green]Cleanup Complete![/bold green]\n\n"
+    "Removed:\n"
+    "{items}\n\n"
+    "[dim]Original game files remain untouched[/dim]\n"
+    "[dim]To reinstall EAC, run \"C:\\Program Files (x86)\\Steam\\steamapps\\common\\DRAGON BALL FighterZ\\EasyAntiCheat\\EasyAntiCheat_Setup.exe\"[/dim]"
+)
 
 
 class DBFZRaidTUI:
@@ -36,6 +88,8 @@ class DBFZRaidTUI:
         self.game_locator = GameLocator()
         self.backup_manager = BackupManager()
         self.shortcut_manager = ShortcutManager()
+        self._raid_table: Optional[Table] = None
+        self._progress: Optional[Progress] = None
 
     def run(self):
         """Main application loop."""
@@ -86,6 +140,8 @@ class DBFZRaidTUI:
         except Exception as e:
             self.console.print(f"\n[red]Unexpected error: {e}[/red]")
             logger.exception("Unexpected error")
+        finally:
+            self.shortcut_manager.close()
 
     def show_header(self):
         """Display application header."""
@@ -100,6 +156,57 @@ class DBFZRaidTUI:
         self.console.print(header)
         self.console.print()
 
+    def _get_progress(self) -> Progress:
+        """Return the shared transient spinner, creating it on first use."""
+        if self._progress is None:
+            self._progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=self.console,
+                transient=True
+            )
+        return self._progress
+
+    @contextmanager
+    def _spinner(self, description: str, total: Optional[float] = None) -> Iterator[Tuple[Progress, int]]:
+        """
+        Show the shared spinner for the duration of a block.
+
+        Args:
+            description: Initial task description
+            total: Task total (None for an indeterminate spinner)
+
+        Yields:
+            Tuple of (progress, task_id)
+        """
+        progress = self._get_progress()
+        progress.start()
+        task = progress.add_task(description, total=total)
+        try:
+            yield progress, task
+        finally:
+            progress.remove_task(task)
+            progress.stop()
+
+    def _wait_for_key(self):
+        """Pause until the user presses a key before exiting or returning."""
+        # Make sure no spinner redraws over the prompt and the log is on disk
+        if self._progress is not None and self._progress.live.is_started:
+            self._progress.stop()
+        for handler in logger.handlers:
+            handler.flush()
+
+        try:
+            import msvcrt
+        except ImportError:
+            self.console.print("[dim]Press Enter to exit...[/dim]")
+            input()
+            return
+
+        self.console.print("[dim]Press any key to exit...[/dim]")
+        self.console.file.flush()
+        msvcrt.getwch()
+
     def detect_game(self) -> Optional[Dict]:
         """
         Detect Steam and DBFZ installation with progress indicator.
@@ -107,13 +214,7 @@ class DBFZRaidTUI:
         Returns:
             Dictionary with game_root and paths, or None if not found
         """
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=self.console,
-            transient=True
-        ) as progress:
-            task = progress.add_task("Detecting Steam installation...", total=None)
+        with self._spinner("Detecting Steam installation...") as (progress, task):
 
             # Find Steam libraries
             try:
@@ -139,8 +240,7 @@ class DBFZRaidTUI:
                     self.console.print()
                     self.console.print(f"[red]{error_msg}[/red]")
                     self.console.print()
-                    self.console.print("[dim]Press Enter to exit...[/dim]")
-                    input()
+                    self._wait_for_key()
                     sys.exit(0)
 
                 self.console.print(f"[yellow]Game not found in Steam libraries. Checking common paths...[/yellow]")
@@ -152,8 +252,7 @@ class DBFZRaidTUI:
                 # If corruption was detected, just wait for Enter to exit
                 if self._found_corrupted_installation:
                     self.console.print()
-                    self.console.print("[dim]Press Enter to exit...[/dim]")
-                    input()
+                    self._wait_for_key()
                     sys.exit(0)
 
                 if game_root and self.game_locator.validate_installation(game_root):
@@ -182,6 +281,27 @@ class DBFZRaidTUI:
 
         return {'game_root': game_root, 'paths': paths}
 
+    @staticmethod
+    def _scan_library(base: str) -> Optional[str]:
+        """
+        Find the DBFZ folder in a Steam library's steamapps/common directory.
+
+        Args:
+            base: Steam library root
+
+        Returns:
+            Game root path string, or None if the library or game folder is missing
+        """
+        common = base + os.sep + _COMMON_SUBPATH
+        try:
+            with os.scandir(common) as entries:
+                for entry in entries:
+                    if entry.name.casefold() == _GAME_FOLDER_KEY and entry.is_dir():
+                        return entry.path
+        except OSError:
+            pass
+        return None
+
     def check_common_paths_with_output(self) -> Optional[Path]:
         """
         Check common paths and show progress to user.
@@ -189,110 +309,54 @@ class DBFZRaidTUI:
         Returns:
             Path to game root if found, None otherwise
         """
-        # Check multiple case variations and path formats
-        base_paths = [
-            (r"C:\Program Files (x86)\Steam", r"c:\program files (x86)\steam"),
-            (r"C:\Program Files\Steam", r"c:\program files\steam"),
-            (r"D:\SteamLibrary", r"d:\steamlibrary"),
-            (r"D:\Steam", r"d:\steam"),
-            (r"E:\SteamLibrary", r"e:\steamlibrary"),
-            (r"E:\Steam", r"e:\steam"),
-        ]
-
-        for base_upper, base_lower in base_paths:
-            # Try both upper and lower case variations
-            for base in [base_upper, base_lower]:
-                game_path = Path(base) / "steamapps" / "common" / "DRAGON BALL FighterZ"
-                exe_path = game_path / "RED" / "Binaries" / "Win64" / "RED-Win64-Shipping.exe"
-
-                # Normalize the path (resolve any .. or . and make absolute)
-                try:
-                    exe_path = exe_path.resolve()
-                except:
-                    pass
-
-                # Convert to absolute string path for consistency
-                exe_path_str = os.path.abspath(str(exe_path))
-
-                # Try multiple methods to check file existence
-                exists_via_path = False
-                exists_via_file = False
-                exists_via_os = False
-                exists_is_file_os = False
-                exists_via_access = False
+        for base in _COMMON_STEAM_BASES:
+            # One directory listing rules out missing drives, libraries and game folders
+            game_root_str = self._scan_library(base)
+            if game_root_str is None:
+                logger.debug("Game not installed under: %s", base)
+                continue
 
-                errors = []
-
-                try:
-                    exists_via_path = exe_path.exists()
-                except Exception as e:
-                    errors.append(f"Path.exists error: {e}")
-
-                try:
-                    exists_via_file = exe_path.is_file()
-                except Exception as e:
-                    errors.append(f"Path.is_file error: {e}")
-
-                # Also try with os.path (more robust on Windows)
-                try:
-                    exists_via_os = os.path.exists(exe_path_str)
-                except Exception as e:
-                    errors.append(f"os.path.exists error: {e}")
+            exe_path_str = game_root_str + os.sep + _EXE_SUBPATH
 
-                try:
-                    exists_is_file_os = os.path.isfile(exe_path_str)
-                except Exception as e:
-                    errors.append(f"os.path.isfile error: {e}")
-
-                # Try os.access (most reliable on Windows, especially in frozen apps)
-                try:
-                    exists_via_access = os.access(exe_path_str, os.R_OK)
-                except Exception as e:
-                    errors.append(f"os.access error: {e}")
-
-                # Log any errors encountered
-                if errors:
-                    for error in errors:
-                        logger.error(error)
-                        self.console.print(f"    [red]{error}[/red]")
-
-                # Log what we found
-                logger.info(f"Checking: {exe_path_str}")
-                logger.info(f"  Path.exists(): {exists_via_path}, Path.is_file(): {exists_via_file}")
-                logger.info(f"  os.path.exists(): {exists_via_os}, os.path.isfile(): {exists_is_file_os}")
-                logger.info(f"  os.access(R_OK): {exists_via_access}")
-
-                # If any method says it exists, accept it
-                if exists_via_path or exists_via_file or exists_via_os or exists_is_file_os or exists_via_access:
-                    self.console.print(f"  [green]→ Found![/green]")
-                    logger.info(f"Found DBFZ at: {game_path}")
-                    return game_path
-                else:
-                    # If this is the first path (most likely), check what's in the directory
-                    if base == base_paths[0][0]:  # First path, first case
-                        parent_dir = os.path.dirname(exe_path_str)
-                        if os.path.exists(parent_dir):
-                            try:
-                                files = os.listdir(parent_dir)
-                                logger.info(f"  Directory exists. Files in {parent_dir}:")
-                                logger.info(f"    {files}")
-                                self.console.print(f"[red]Game folder found but executable is missing.[/red]")
-                                self.console.print(f"[cyan]Verify game files: Right-click DBFZ in Steam → Properties → Installed Files → Verify integrity[/cyan]")
-                                self.console.print(f"[cyan]If that doesn't work, reinstall the game[/cyan]")
-                                self._found_corrupted_installation = True
-                            except Exception as e:
-                                logger.error(f"  Could not list directory: {e}")
-                        else:
-                            # Check if game root exists
-                            game_root_str = str(game_path)
-                            if os.path.exists(game_root_str):
-                                logger.info(f"  Game root exists but Win64 directory missing: {game_root_str}")
-                                self.console.print(f"[red]\nGame folder found but installation is incomplete.[/red]")
-                                self.console.print(f"[cyan]Verify game files: Right-click DBFZ in Steam → Properties → Installed Files → Verify integrity[/cyan]")
-                                self.console.print(f"[cyan]If that doesn't work, reinstall the game[/cyan]")
-                                self._found_corrupted_installation = True
-                            else:
-                                logger.info(f"  Game not installed at: {game_root_str}")
+            # One stat answers both "exists" and "is a regular file"
+            try:
+                found = stat.S_ISREG(os.stat(exe_path_str).st_mode)
+            except (FileNotFoundError, NotADirectoryError):
+                found = False
+            except OSError as e:
+                # Stat refused (e.g. permissions); fall back to an attribute-only probe
+                error = f"os.stat error: {e}"
+                logger.error(error)
+                self.console.print(f"    [red]{error}[/red]")
+                found = os.access(exe_path_str, os.F_OK)
+
+            logger.debug("Checking: %s (found: %s)", exe_path_str, found)
+
+            if found:
+                self.console.print(f"  [green]→ Found![/green]")
+                logger.info(f"Found DBFZ at: {game_root_str}")
+                return Path(game_root_str)
+            else:
+                # If this is the first path (most likely), check what's in the directory
+                if base == _COMMON_STEAM_BASES[0]:  # First path
+                    parent_dir = os.path.dirname(exe_path_str)
+                    if os.path.exists(parent_dir):
+                        try:
+                            files = os.listdir(parent_dir)
+                            logger.info("  Directory exists. Files in %s:\n    %s", parent_dir, files)
+                            self.console.print(f"[red]Game folder found but executable is missing.[/red]")
+                            self.console.print(f"[cyan]Verify game files: Right-click DBFZ in Steam → Properties → Installed Files → Verify integrity[/cyan]")
+                            self.console.print(f"[cyan]If that doesn't work, reinstall the game[/cyan]")
+                            self._found_corrupted_installation = True
+                        except Exception as e:
+                            logger.error(f"  Could not list directory: {e}")
+                    else:
+                        # Game root came from the scan, so only Win64 is missing
+                        logger.info(f"  Game root exists but Win64 directory missing: {game_root_str}")
+                        self.console.print(f"[red]\nGame folder found but installation is incomplete.[/red]")
+                        self.console.print(f"[cyan]Verify game files: Right-click DBFZ in Steam → Properties → Installed Files → Verify integrity[/cyan]")
+                        self.console.print(f"[cyan]If that doesn't work, reinstall the game[/cyan]")
+                        self._found_corrupted_installation = True
 
         return None
 
@@ -395,18 +459,13 @@ class DBFZRaidTUI:
         paths = game_info['paths']
         return self.backup_manager.detect_current_patch(paths['patched_exe'])
 
-    def show_raid_menu(self, current_raid: Optional[int]) -> Union[int, str, None]:
+    def _build_raid_table(self) -> Table:
         """
-        Display interactive raid selection menu.
-
-        Args:
-            current_raid: Currently patched raid index (or None)
+        Build the raid selection table.
 
         Returns:
-            Selected raid index (int), 'cleanup' for cleanup, or None if cancelled
+            Rich Table listing every raid
         """
-        raids = get_all_raids_with_bosses()
-
         # Create table
         table = Table(
             title="Vanilla Raid Table",
@@ -422,11 +481,26 @@ class DBFZRaidTUI:
         table.add_column("Enemies", style="dim", no_wrap=False)
 
         # Add rows (escape to prevent Rich markup interpretation)
-        for idx, name, boss, characters, risk in raids:
-            risk_stars = "★" * risk
-            table.add_row(str(idx), escape(name), risk_stars, escape(boss), escape(characters))
+        for idx, name, boss, characters, risk in get_all_raids_with_bosses():
+            table.add_row(str(idx), escape(name), _RISK_STARS[risk], escape(boss), escape(characters))
+
+        return table
+
+    def show_raid_menu(self, current_raid: Optional[int]) -> Union[int, str, None]:
+        """
+        Display interactive raid selection menu.
+
+        Args:
+            current_raid: Currently patched raid index (or None)
 
-        self.console.print(table)
+        Returns:
+            Selected raid index (int), 'cleanup' for cleanup, or None if cancelled
+        """
+        # Static table; built once and reprinted on later menu loops
+        if self._raid_table is None:
+            self._raid_table = self._build_raid_table()
+
+        self.console.print(self._raid_table)
         self.console.print()
 
         # Show current patch below the table
@@ -438,7 +512,7 @@ class DBFZRaidTUI:
         while True:
             try:
                 choice = Prompt.ask(
-                    "Select a raid (1-38), 'c' to cleanup, or 'q' to quit",
+                    _RAID_PROMPT,
                     console=self.console
                 )
 
@@ -464,6 +538,28 @@ class DBFZRaidTUI:
                 self.console.print()  # blank line for visual separation
                 return None
 
+    @staticmethod
+    def _remove_old_shortcuts(game_root: Path):
+        """
+        Delete existing raid shortcuts from the game folder.
+
+        Args:
+            game_root: Game installation root containing the shortcuts
+        """
+        # scandir entries carry type info, so no per-entry stat or Path objects
+        try:
+            with os.scandir(game_root) as entries:
+                for entry in entries:
+                    if not is_raid_shortcut_name(entry.name):
+                        continue
+                    try:
+                        logger.info(f"Removing old shortcut: {entry.name}")
+                        os.unlink(entry.path)
+                    except Exception as e:
+                        logger.warning(f"Could not remove old shortcut: {e}")
+        except Exception as e:
+            logger.warning(f"Error scanning for old shortcuts: {e}")
+
     def execute_patch_workflow(
         self,
         game_info: Dict,
@@ -490,8 +586,7 @@ class DBFZRaidTUI:
 
         self.console.print(f"\n[bold]Patching for: Raid {raid_index}[/bold]\n")
 
-        with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=self.console, transient=True) as progress:
-            task = progress.add_task("Processing...", total=4)
+        with self._spinner("Processing...", total=4) as (progress, task):
 
             # Step 1: Verify clean exe
             progress.update(task, description="Verifying clean exe...")
@@ -540,18 +635,10 @@ class DBFZRaidTUI:
             progress.update(task, description="Creating shortcuts...")
 
             # Delete old shortcuts before creating new one
-            try:
-                for old_shortcut in game_root.glob("DBFZ Raid *.lnk"):
-                    try:
-                        logger.info(f"Removing old shortcut: {old_shortcut.name}")
-                        old_shortcut.unlink()
-                    except Exception as e:
-                        logger.warning(f"Could not remove old shortcut: {e}")
-            except Exception as e:
-                logger.warning(f"Error scanning for old shortcuts: {e}")
+            self._remove_old_shortcuts(game_root)
 
             # Generate shortcut filename
-            shortcut_name = f"DBFZ Raid {raid_index}.lnk"
+            shortcut_name = SHORTCUT_NAME_TEMPLATE.format(raid_index)
             shortcut_path = game_root / shortcut_name
 
             try:
@@ -601,7 +688,6 @@ class DBFZRaidTUI:
         # Ask if user wants to open the folder
         if Confirm.ask("Open folder where shortcut is located?", default=True):
             try:
-                import os
                 os.startfile(shortcut_path.parent)
             except Exception as e:
                 logger.warning(f"Could not open folder: {e}")
@@ -637,8 +723,7 @@ class DBFZRaidTUI:
 
         # Execute cleanup with transient spinner
         try:
-            with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=self.console, transient=True) as progress:
-                task = progress.add_task("Preparing cleanup...", total=None)
+            with self._spinner("Preparing cleanup...") as (progress, task):
 
                 # Provide a simple callback so `cleanup_all` can update the progress message
                 def _update(msg: str):
@@ -692,48 +777,45 @@ class DBFZRaidTUI:
                 # Failure panel - treat cleanup as failed
                 self.console.print()
                 failure_panel = Panel(
-                    f"[bold red]Cleanup failed[/bold red]\n\n"
-                    f"Removed (partial):\n" +
-                    "\n".join(f"  • {item}" for item in items_removed) + "\n\n"
-                    f"[dim]Original game files may have been partially modified. Please inspect the errors above and restore files manually if needed.[/dim]",
+                    "\n".join([
+                        "[bold red]Cleanup failed[/bold red]",
+                        "",
+                        "Removed (partial):",
+                        *(f"  • {item}" for item in items_removed),
+                        "",
+                        "[dim]Original game files may have been partially modified. Please inspect the errors above and restore files manually if needed.[/dim]"
+                    ]),
                     box=box.DOUBLE,
                     border_style="red",
                     title="Failure"
                 )
                 self.console.print(failure_panel)
                 self.console.print()
-                self.console.print("[dim]Press Enter to exit...[/dim]")
-                input()
+                self._wait_for_key()
                 # Return True to indicate cleanup ran (even if it failed)
                 return True
 
-            # Success message
             self.console.print()
-            if items_removed:
-                cleanup_panel = Panel(
-                    f"[bold green]Cleanup Complete![/bold green]\n\n"
-                    f"Removed:\n" +
-                    "\n".join(f"  • {item}" for item in items_removed) + "\n\n"
-                    f"[dim]Original game files remain untouched[/dim]\n"
-                    f"[dim]To reinstall EAC, run \"C:\\Program Files (x86)\\Steam\\steamapps\\common\\DRAGON BALL FighterZ\\EasyAntiCheat\\EasyAntiCheat_Setup.exe\"[/dim]",
-                    box=box.DOUBLE,
-                    border_style="green",
-                    title="Success"
-                )
-            else:
-                cleanup_panel = Panel(
-                    f"[bold yellow]Nothing to Clean[/bold yellow]\n\n"
-                    f"No modifications found\n"
-                    f"[dim]Game files are already clean[/dim]",
-                    box=box.ROUNDED,
-                    border_style="yellow",
-                    title="Info"
-                )
 
+            # Nothing removed: show the prebuilt panel without formatting a success body
+            if not items_removed:
+                self.console.print(_NOTHING_TO_CLEAN_PANEL)
+                self.console.print()
+                self._wait_for_key()
+                return True
+
+            # Success message
+            cleanup_panel = Panel(
+                _CLEANUP_SUCCESS_TEMPLATE.format(
+                    items="\n".join(f"  • {item}" for item in items_removed)
+                ),
+                box=box.DOUBLE,
+                border_style="green",
+                title="Success"
+            )
             self.console.print(cleanup_panel)
             self.console.print()
-            self.console.print("[dim]Press Enter to exit...[/dim]")
-            input()
+            self._wait_for_key()
             # Return True to indicate cleanup ran (success)
             return True
 
@@ -750,40 +832,27 @@ class DBFZRaidTUI:
         Clean up only the application logs directory.
         Used when game path is not available.
         """
-        import shutil
-
-        log_dir = Path.home() / ".dbfz_raid_enabler"
+        log_dir = LOG_DIR
 
         self.console.print()
         self.console.print("[yellow]This will remove application logs:[/yellow]")
         self.console.print(f"  • {log_dir}")
         self.console.print()
 
-        if not Confirm.ask("Are you sure?", default=False):
+        # Plain prompt: nothing to style here, so skip Rich's prompt rendering
+        if input("Are you sure? [y/N] ").strip().lower() not in ("y", "yes"):
             self.console.print("\n[yellow]Operation cancelled.[/yellow]\n")
             return
 
         try:
-            if log_dir.exists():
+            if log_dir.is_dir():
                 # Close log file handlers before deleting
-                for handler in logger.handlers[:]:
-                    try:
-                        base_filename = getattr(handler, 'baseFilename', None)
-                        if base_filename:
-                            handler_path = Path(base_filename).resolve()
-                            log_dir_resolved = log_dir.resolve()
-                            if log_dir_resolved == handler_path or log_dir_resolved in handler_path.parents:
-                                handler.flush()
-                                handler.close()
-                                logger.removeHandler(handler)
-                    except Exception:
-                        pass
+                close_log_handlers(log_dir)
 
-                shutil.rmtree(log_dir)
+                remove_tree(log_dir)
                 self.console.print("[green]✓ Logs directory removed[/green]")
                 self.console.print()
-                self.console.print("[dim]Press Enter to exit...[/dim]")
-                input()
+                self._wait_for_key()
                 sys.exit(0)
             else:
                 self.console.print("[dim]• Logs directory not found[/dim]")
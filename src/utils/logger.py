@@ -4,6 +4,9 @@ import logging
 import sys
 from pathlib import Path
 
+# Application data directory holding the log file
+LOG_DIR = Path.home() / ".dbfz_raid_enabler"
+
 
 def setup_logger(name: str = "dbfz_raid", level: int = logging.INFO) -> logging.Logger:
     """
@@ -20,7 +23,7 @@ def setup_logger(name: str = "dbfz_raid", level: int = logging.INFO) -> logging.
     logger.setLevel(level)
 
     # Create log directory if it doesn't exist
-    log_dir = Path.home() / ".dbfz_raid_enabler"
+    log_dir = LOG_DIR
     log_dir.mkdir(exist_ok=True)
 
     # File handler